@@ -1,10 +1,11 @@
 """OpenTelemetry Bedrock instrumentation"""
-from functools import wraps
+from functools import lru_cache, wraps
+from io import BytesIO
 import json
 import logging
 import os
 from typing import Collection
-from opentelemetry.instrumentation.bedrock.reusable_streaming_body import ReusableStreamingBody
+from botocore.response import StreamingBody
 from wrapt import wrap_function_wrapper
 
 from opentelemetry import context as context_api
@@ -19,6 +20,12 @@ from opentelemetry.instrumentation.utils import (
 from opentelemetry.semconv.ai import SpanAttributes, LLMRequestTypeValues
 from opentelemetry.instrumentation.bedrock.version import __version__
 
+try:
+    # orjson parses bytes directly and is considerably faster for large prompts
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 _instruments = ("boto3 >= 1.28.57",)
@@ -31,6 +38,38 @@ WRAPPED_METHODS = [
     }
 ]
 
+_CROSS_REGION_PREFIXES = frozenset(("us", "us-gov", "eu", "apac", "ca", "jp", "au", "global"))
+
+_PROMPT_USER_KEY = f"{SpanAttributes.LLM_PROMPTS}.0.user"
+_COMPLETION_KEYS = tuple(f"{SpanAttributes.LLM_COMPLETIONS}.{i}.content" for i in range(32))
+
+_COHERE_REQUEST_ATTRIBUTES = (
+    ("p", SpanAttributes.LLM_TOP_P),
+    ("temperature", SpanAttributes.LLM_TEMPERATURE),
+    ("max_tokens", SpanAttributes.LLM_REQUEST_MAX_TOKENS),
+)
+_ANTHROPIC_REQUEST_ATTRIBUTES = (
+    ("top_p", SpanAttributes.LLM_TOP_P),
+    ("temperature", SpanAttributes.LLM_TEMPERATURE),
+    ("max_tokens_to_sample", SpanAttributes.LLM_REQUEST_MAX_TOKENS),
+)
+_AI21_REQUEST_ATTRIBUTES = (
+    ("topP", SpanAttributes.LLM_TOP_P),
+    ("temperature", SpanAttributes.LLM_TEMPERATURE),
+    ("maxTokens", SpanAttributes.LLM_REQUEST_MAX_TOKENS),
+)
+_LLAMA_REQUEST_ATTRIBUTES = (
+    ("top_p", SpanAttributes.LLM_TOP_P),
+    ("temperature", SpanAttributes.LLM_TEMPERATURE),
+    ("max_gen_len", SpanAttributes.LLM_REQUEST_MAX_TOKENS),
+)
+
+
+def _completion_key(index):
+    if index < len(_COMPLETION_KEYS):
+        return _COMPLETION_KEYS[index]
+    return f"{SpanAttributes.LLM_COMPLETIONS}.{index}.content"
+
 
 def should_send_prompts():
     return (
@@ -45,6 +84,12 @@ def _set_span_attribute(span, name, value):
     return
 
 
+def _set_span_attributes(span, attributes):
+    span.set_attributes(
+        {name: value for name, value in attributes.items() if value is not None and value != ""}
+    )
+
+
 def _with_tracer_wrapper(func):
     """Helper for providing tracer for wrapper functions."""
 
@@ -60,16 +105,15 @@ def _with_tracer_wrapper(func):
 @_with_tracer_wrapper
 def _wrap(tracer, to_wrap, wrapped, instance, args, kwargs):
     """Instruments and calls every function defined in TO_WRAP."""
-    if context_api.get_value(_SUPPRESS_INSTRUMENTATION_KEY):
+    if kwargs.get("service_name") != "bedrock-runtime" or context_api.get_value(
+        _SUPPRESS_INSTRUMENTATION_KEY
+    ):
         return wrapped(*args, **kwargs)
 
-    if kwargs.get("service_name") == "bedrock-runtime":
-        client = wrapped(*args, **kwargs)
-        client.invoke_model = _instrumented_model_invoke(client.invoke_model, tracer)
+    client = wrapped(*args, **kwargs)
+    client.invoke_model = _instrumented_model_invoke(client.invoke_model, tracer)
 
-        return client
-
-    return wrapped(*args, **kwargs)
+    return client
 
 
 def _instrumented_model_invoke(fn, tracer):
@@ -80,84 +124,111 @@ def _instrumented_model_invoke(fn, tracer):
             kind=SpanKind.CLIENT
         ) as span:
             response = fn(*args, **kwargs)
-            response['body'] = ReusableStreamingBody(response['body']._raw_stream, response['body']._content_length)
-            request_body = json.loads(kwargs.get("body"))
-            response_body = json.loads(response.get("body").read())
 
-            if span.is_recording():
-                (vendor, model) = kwargs.get("modelId").split(".")
+            model_id = kwargs.get("modelId")
+            if not span.is_recording() or not model_id:
+                return response
+
+            (vendor, model, set_vendor_span_attributes) = _resolve_model_id(model_id)
+
+            _set_span_attribute(span, SpanAttributes.LLM_VENDOR, vendor)
+            _set_span_attribute(span, SpanAttributes.LLM_REQUEST_MODEL, model)
+
+            if not set_vendor_span_attributes:
+                return response
 
-                _set_span_attribute(span, SpanAttributes.LLM_VENDOR, vendor)
-                _set_span_attribute(span, SpanAttributes.LLM_REQUEST_MODEL, model)
+            response_body = _get_body(response)
+            if response_body is None:
+                return response
 
-                if vendor == "cohere":
-                    _set_cohere_span_attributes(span, request_body, response_body)
-                elif vendor == "anthropic":
-                    _set_anthropic_span_attributes(span, request_body, response_body)
-                elif vendor == "ai21":
-                    _set_ai21_span_attributes(span, request_body, response_body)
-                elif vendor == "meta":
-                    _set_llama_span_attributes(span, request_body, response_body)
+            body = kwargs.get("body")
+            request_body = _loads(body) if isinstance(body, (bytes, str)) else {}
+            set_vendor_span_attributes(span, request_body, response_body)
 
             return response
 
     return with_instrumentation
 
 
+@lru_cache(maxsize=64)
+def _resolve_model_id(model_id):
+    """Splits a model ID into its vendor and model and finds the vendor's attribute setter.
+
+    Accepts plain model IDs, cross-region inference profile IDs (e.g. us.anthropic.claude-v2)
+    and ARNs, whose resource prefix is stripped first.
+    """
+    vendor, _, model = model_id.rpartition("/")[2].partition(".")
+    if vendor in _CROSS_REGION_PREFIXES and "." in model:
+        vendor, _, model = model.partition(".")
+    return vendor, model, _VENDOR_SPAN_ATTRIBUTE_SETTERS.get(vendor)
+
+
+def _get_body(response):
+    """Parses the response body, leaving the stream untouched unless it is JSON."""
+    if response.get("contentType") != "application/json":
+        return None
+
+    body = response['body'].read()
+    response['body'] = StreamingBody(BytesIO(body), len(body))
+    return _loads(body)
+
+
+def _request_attributes(request_body, request_attributes):
+    attributes = {SpanAttributes.LLM_REQUEST_TYPE: LLMRequestTypeValues.COMPLETION.value}
+    attributes.update((name, request_body.get(key)) for key, name in request_attributes)
+    return attributes
+
+
 def _set_cohere_span_attributes(span, request_body, response_body):
-    _set_span_attribute(span, SpanAttributes.LLM_REQUEST_TYPE, LLMRequestTypeValues.COMPLETION.value)
-    _set_span_attribute(span, SpanAttributes.LLM_TOP_P, request_body.get("p"))
-    _set_span_attribute(span, SpanAttributes.LLM_TEMPERATURE, request_body.get("temperature"))
-    _set_span_attribute(span, SpanAttributes.LLM_REQUEST_MAX_TOKENS, request_body.get("max_tokens"))
+    attributes = _request_attributes(request_body, _COHERE_REQUEST_ATTRIBUTES)
 
     if should_send_prompts():
-        _set_span_attribute(span, f"{SpanAttributes.LLM_PROMPTS}.0.user", request_body.get("prompt"))
+        attributes[_PROMPT_USER_KEY] = request_body.get("prompt")
 
         for i, generation in enumerate(response_body.get("generations")):
-            _set_span_attribute(span, f"{SpanAttributes.LLM_COMPLETIONS}.{i}.content", generation.get("text"))
+            attributes[_completion_key(i)] = generation.get("text")
+
+    _set_span_attributes(span, attributes)
 
 
 def _set_anthropic_span_attributes(span, request_body, response_body):
-    _set_span_attribute(span, SpanAttributes.LLM_REQUEST_TYPE, LLMRequestTypeValues.COMPLETION.value)
-    _set_span_attribute(span, SpanAttributes.LLM_TOP_P, request_body.get("top_p"))
-    _set_span_attribute(span, SpanAttributes.LLM_TEMPERATURE, request_body.get("temperature"))
-    _set_span_attribute(span, SpanAttributes.LLM_REQUEST_MAX_TOKENS, request_body.get("max_tokens_to_sample"))
+    attributes = _request_attributes(request_body, _ANTHROPIC_REQUEST_ATTRIBUTES)
 
     if should_send_prompts():
-        _set_span_attribute(span, f"{SpanAttributes.LLM_PROMPTS}.0.user", request_body.get("prompt"))
-        _set_span_attribute(span, f"{SpanAttributes.LLM_COMPLETIONS}.0.content", response_body.get("completion"))
+        attributes[_PROMPT_USER_KEY] = request_body.get("prompt")
+        attributes[_COMPLETION_KEYS[0]] = response_body.get("completion")
+
+    _set_span_attributes(span, attributes)
 
 
 def _set_ai21_span_attributes(span, request_body, response_body):
-    _set_span_attribute(span, SpanAttributes.LLM_REQUEST_TYPE, LLMRequestTypeValues.COMPLETION.value)
-    _set_span_attribute(span, SpanAttributes.LLM_TOP_P, request_body.get("topP"))
-    _set_span_attribute(span, SpanAttributes.LLM_TEMPERATURE, request_body.get("temperature"))
-    _set_span_attribute(span, SpanAttributes.LLM_REQUEST_MAX_TOKENS, request_body.get("maxTokens"))
+    attributes = _request_attributes(request_body, _AI21_REQUEST_ATTRIBUTES)
 
     if should_send_prompts():
-        _set_span_attribute(
-            span,
-            f"{SpanAttributes.LLM_PROMPTS}.0.user", request_body.get("prompt")
-        )
+        attributes[_PROMPT_USER_KEY] = request_body.get("prompt")
 
         for i, completion in enumerate(response_body.get("completions")):
-            _set_span_attribute(
-                span,
-                f"{SpanAttributes.LLM_COMPLETIONS}.{i}.content", completion.get("data").get("text")
-            )
+            attributes[_completion_key(i)] = completion.get("data").get("text")
+
+    _set_span_attributes(span, attributes)
 
 
 def _set_llama_span_attributes(span, request_body, response_body):
-    _set_span_attribute(span, SpanAttributes.LLM_REQUEST_TYPE, LLMRequestTypeValues.COMPLETION.value)
-    _set_span_attribute(span, SpanAttributes.LLM_TOP_P, request_body.get("top_p"))
-    _set_span_attribute(span, SpanAttributes.LLM_TEMPERATURE, request_body.get("temperature"))
-    _set_span_attribute(span, SpanAttributes.LLM_REQUEST_MAX_TOKENS, request_body.get("max_gen_len"))
+    attributes = _request_attributes(request_body, _LLAMA_REQUEST_ATTRIBUTES)
 
     if should_send_prompts():
-        _set_span_attribute(span, f"{SpanAttributes.LLM_PROMPTS}.0.user", request_body.get("prompt"))
+        attributes[_PROMPT_USER_KEY] = request_body.get("prompt")
+        attributes[_COMPLETION_KEYS[0]] = response_body.get("generation")
 
-        for i, generation in enumerate(response_body.get("generations")):
-            _set_span_attribute(span, f"{SpanAttributes.LLM_COMPLETIONS}.{i}.content", response_body)
+    _set_span_attributes(span, attributes)
+
+
+_VENDOR_SPAN_ATTRIBUTE_SETTERS = {
+    "cohere": _set_cohere_span_attributes,
+    "anthropic": _set_anthropic_span_attributes,
+    "ai21": _set_ai21_span_attributes,
+    "meta": _set_llama_span_attributes,
+}
 
 
 class BedrockInstrumentor(BaseInstrumentor):
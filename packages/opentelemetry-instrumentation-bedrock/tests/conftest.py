@@ -1,3 +1,54 @@
 """Unit tests configuration module."""
 
+import boto3
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
+from opentelemetry.instrumentation.bedrock import BedrockInstrumentor
+
 pytest_plugins = []
+
+
+@pytest.fixture(scope="session")
+def exporter():
+    exporter = InMemorySpanExporter()
+    processor = SimpleSpanProcessor(exporter)
+
+    provider = TracerProvider()
+    provider.add_span_processor(processor)
+    trace.set_tracer_provider(provider)
+
+    BedrockInstrumentor().instrument()
+
+    return exporter
+
+
+@pytest.fixture(autouse=True)
+def clear_exporter(exporter):
+    exporter.clear()
+
+
+def _bedrock_runtime_client():
+    return boto3.client(
+        service_name="bedrock-runtime",
+        region_name="us-east-1",
+        aws_access_key_id="test_access_key",
+        aws_secret_access_key="test_secret_key",
+    )
+
+
+@pytest.fixture
+def brt(exporter):
+    return _bedrock_runtime_client()
+
+
+@pytest.fixture
+def non_recording_brt(exporter):
+    BedrockInstrumentor().uninstrument()
+    BedrockInstrumentor().instrument(tracer_provider=TracerProvider(sampler=ALWAYS_OFF))
+    yield _bedrock_runtime_client()
+    BedrockInstrumentor().uninstrument()
+    BedrockInstrumentor().instrument()
@@ -0,0 +1,242 @@
+import json
+from io import BytesIO
+
+import boto3
+import pytest
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+from opentelemetry import context as context_api
+from opentelemetry.instrumentation import bedrock
+from opentelemetry.instrumentation.utils import _SUPPRESS_INSTRUMENTATION_KEY
+
+
+@pytest.fixture(params=["orjson", "json"])
+def body_parser(request, monkeypatch):
+    if request.param == "orjson":
+        loads = pytest.importorskip("orjson").loads
+    else:
+        loads = json.loads
+    monkeypatch.setattr(bedrock, "_loads", loads)
+
+
+def _streaming_body(payload):
+    return StreamingBody(BytesIO(payload), len(payload))
+
+
+def _invoke_model(brt, model_id, request_body, response_body, content_type="application/json"):
+    return _invoke_model_with_stream(
+        brt, model_id, request_body, _streaming_body(json.dumps(response_body).encode()), content_type
+    )
+
+
+def _invoke_model_with_stream(brt, model_id, request_body, stream, content_type="application/json"):
+    with Stubber(brt) as stubber:
+        stubber.add_response("invoke_model", {"body": stream, "contentType": content_type})
+        return brt.invoke_model(
+            modelId=model_id,
+            body=json.dumps(request_body),
+            accept=content_type,
+            contentType="application/json",
+        )
+
+
+def test_cohere_completion(exporter, brt, body_parser):
+    _invoke_model(
+        brt,
+        "cohere.command-text-v14",
+        {"prompt": "Tell me a joke", "p": 0.5, "temperature": 0.1, "max_tokens": 100},
+        {"generations": [{"text": "First joke"}, {"text": "Second joke"}]},
+    )
+
+    spans = exporter.get_finished_spans()
+    assert [span.name for span in spans] == ["bedrock.completion"]
+    attributes = spans[0].attributes
+    assert attributes["llm.vendor"] == "cohere"
+    assert attributes["llm.request.model"] == "command-text-v14"
+    assert attributes["llm.request.type"] == "completion"
+    assert attributes["llm.top_p"] == 0.5
+    assert attributes["llm.temperature"] == 0.1
+    assert attributes["llm.request.max_tokens"] == 100
+    assert attributes["llm.prompts.0.user"] == "Tell me a joke"
+    assert attributes["llm.completions.0.content"] == "First joke"
+    assert attributes["llm.completions.1.content"] == "Second joke"
+
+
+def test_anthropic_completion(exporter, brt, body_parser):
+    _invoke_model(
+        brt,
+        "anthropic.claude-v2",
+        {"prompt": "Tell me a joke", "top_p": 0.5, "temperature": 0.1, "max_tokens_to_sample": 100},
+        {"completion": "A joke"},
+    )
+
+    attributes = exporter.get_finished_spans()[0].attributes
+    assert attributes["llm.vendor"] == "anthropic"
+    assert attributes["llm.request.model"] == "claude-v2"
+    assert attributes["llm.top_p"] == 0.5
+    assert attributes["llm.temperature"] == 0.1
+    assert attributes["llm.request.max_tokens"] == 100
+    assert attributes["llm.prompts.0.user"] == "Tell me a joke"
+    assert attributes["llm.completions.0.content"] == "A joke"
+
+
+def test_ai21_completion(exporter, brt, body_parser):
+    _invoke_model(
+        brt,
+        "ai21.j2-ultra-v1",
+        {"prompt": "Tell me a joke", "topP": 0.5, "temperature": 0.1, "maxTokens": 100},
+        {"completions": [{"data": {"text": "A joke"}}]},
+    )
+
+    attributes = exporter.get_finished_spans()[0].attributes
+    assert attributes["llm.vendor"] == "ai21"
+    assert attributes["llm.request.model"] == "j2-ultra-v1"
+    assert attributes["llm.top_p"] == 0.5
+    assert attributes["llm.temperature"] == 0.1
+    assert attributes["llm.request.max_tokens"] == 100
+    assert attributes["llm.prompts.0.user"] == "Tell me a joke"
+    assert attributes["llm.completions.0.content"] == "A joke"
+
+
+def test_llama_completion(exporter, brt, body_parser):
+    _invoke_model(
+        brt,
+        "meta.llama2-13b-chat-v1",
+        {"prompt": "Tell me a joke", "top_p": 0.5, "temperature": 0.1, "max_gen_len": 100},
+        {"generation": "A joke", "stop_reason": "stop"},
+    )
+
+    attributes = exporter.get_finished_spans()[0].attributes
+    assert attributes["llm.vendor"] == "meta"
+    assert attributes["llm.request.model"] == "llama2-13b-chat-v1"
+    assert attributes["llm.top_p"] == 0.5
+    assert attributes["llm.temperature"] == 0.1
+    assert attributes["llm.request.max_tokens"] == 100
+    assert attributes["llm.prompts.0.user"] == "Tell me a joke"
+    assert attributes["llm.completions.0.content"] == "A joke"
+
+
+def test_response_body_is_readable_after_instrumentation(exporter, brt):
+    response_body = {"completion": "A joke"}
+    response = _invoke_model(brt, "anthropic.claude-v2", {"prompt": "Tell me a joke"}, response_body)
+
+    assert response["body"].read() == json.dumps(response_body).encode()
+
+
+def test_response_body_chunks_are_iterable_after_instrumentation(exporter, brt):
+    response_body = {"completion": "A joke"}
+    response = _invoke_model(brt, "anthropic.claude-v2", {"prompt": "Tell me a joke"}, response_body)
+
+    assert b"".join(response["body"].iter_chunks(chunk_size=4)) == json.dumps(response_body).encode()
+
+
+def test_non_json_response_body_is_left_unread(exporter, brt):
+    raw_stream = BytesIO(b"<completion>A joke</completion>")
+    stream = StreamingBody(raw_stream, len(raw_stream.getvalue()))
+
+    response = _invoke_model_with_stream(
+        brt, "anthropic.claude-v2", {"prompt": "Tell me a joke"}, stream, "application/xml"
+    )
+
+    assert response["body"] is stream
+    assert raw_stream.tell() == 0
+    assert dict(exporter.get_finished_spans()[0].attributes) == {
+        "llm.vendor": "anthropic",
+        "llm.request.model": "claude-v2",
+    }
+
+
+def test_non_recording_span_leaves_response_body_unread(non_recording_brt):
+    raw_stream = BytesIO(b'{"completion": "A joke"}')
+    stream = StreamingBody(raw_stream, len(raw_stream.getvalue()))
+
+    response = _invoke_model_with_stream(non_recording_brt, "anthropic.claude-v2", {"prompt": "Tell me a joke"}, stream)
+
+    assert response["body"] is stream
+    assert raw_stream.tell() == 0
+
+
+def test_unknown_vendor_response_body_is_left_unread(exporter, brt):
+    raw_stream = BytesIO(b'{"results": [{"outputText": "A joke"}]}')
+    stream = StreamingBody(raw_stream, len(raw_stream.getvalue()))
+
+    response = _invoke_model_with_stream(
+        brt, "amazon.titan-text-express-v1", {"inputText": "Tell me a joke"}, stream
+    )
+
+    assert response["body"] is stream
+    assert raw_stream.tell() == 0
+    assert dict(exporter.get_finished_spans()[0].attributes) == {
+        "llm.vendor": "amazon",
+        "llm.request.model": "titan-text-express-v1",
+    }
+
+
+def test_cross_region_model_id(exporter, brt):
+    _invoke_model(brt, "us.anthropic.claude-v2", {"prompt": "Tell me a joke"}, {"completion": "A joke"})
+
+    attributes = exporter.get_finished_spans()[0].attributes
+    assert attributes["llm.vendor"] == "anthropic"
+    assert attributes["llm.request.model"] == "claude-v2"
+    assert attributes["llm.completions.0.content"] == "A joke"
+
+
+def test_arn_model_id(exporter, brt):
+    _invoke_model(
+        brt,
+        "arn:aws:bedrock:us-east-1::foundation-model/anthropic.claude-v2",
+        {"prompt": "Tell me a joke"},
+        {"completion": "A joke"},
+    )
+
+    attributes = exporter.get_finished_spans()[0].attributes
+    assert attributes["llm.vendor"] == "anthropic"
+    assert attributes["llm.request.model"] == "claude-v2"
+    assert attributes["llm.completions.0.content"] == "A joke"
+
+
+def test_inference_profile_arn_model_id(exporter, brt):
+    _invoke_model(
+        brt,
+        "arn:aws:bedrock:us-east-1:123456789012:inference-profile/us.anthropic.claude-v2",
+        {"prompt": "Tell me a joke"},
+        {"completion": "A joke"},
+    )
+
+    attributes = exporter.get_finished_spans()[0].attributes
+    assert attributes["llm.vendor"] == "anthropic"
+    assert attributes["llm.request.model"] == "claude-v2"
+
+
+def test_other_service_clients_are_not_wrapped(exporter):
+    s3 = boto3.client(
+        service_name="s3",
+        region_name="us-east-1",
+        aws_access_key_id="test_access_key",
+        aws_secret_access_key="test_secret_key",
+    )
+
+    assert "invoke_model" not in vars(s3)
+
+
+def test_bedrock_client_is_not_wrapped_when_instrumentation_is_suppressed(exporter):
+    token = context_api.attach(context_api.set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
+    try:
+        brt = boto3.client(
+            service_name="bedrock-runtime",
+            region_name="us-east-1",
+            aws_access_key_id="test_access_key",
+            aws_secret_access_key="test_secret_key",
+        )
+    finally:
+        context_api.detach(token)
+
+    assert "invoke_model" not in vars(brt)
+
+    _invoke_model(brt, "anthropic.claude-v2", {"prompt": "Tell me a joke"}, {"completion": "A joke"})
+
+    assert exporter.get_finished_spans() == ()
+
+
+def test_bedrock_client_is_wrapped(brt):
+    assert "invoke_model" in vars(brt)
@@ -1,2 +0,0 @@
-def test_placeholder():
-    pass